@@ -84,6 +84,7 @@ in
       pytest-django
       pytest-playwright
       pytest-mock
+      pytest-xdist
       cvss
       freezegun
       django-model-utils
@@ -10,7 +10,8 @@ let
     documentation.enable = lib.mkDefault false;
 
     virtualisation = {
-      memorySize = 2048;
+      # Parallel test workers each run their own browser.
+      memorySize = 3072;
       cores = 2;
       diskSize = 4096;
     };
@@ -163,7 +164,13 @@ pkgs.testers.runNixOSTest {
             This is because `conftest.py` files are discovered from the provided module names and registered globally.
           */
         }server.succeed("wst-manage test -- --pyargs api -v | tee /dev/ttyS0")
-        server.succeed("wst-manage test -- --pyargs webview -v | tee /dev/ttyS0")
+        ${
+          ""
+          /*
+            The browser tests dominate the run time and are bound by I/O, not by Python.
+            Each `pytest-xdist` worker gets its own test database and live server.
+          */
+        }server.succeed("wst-manage test -- --pyargs webview -n auto -v | tee /dev/ttyS0")
 
       with subtest("Check that stylesheet is served"):
         machine.succeed("curl --fail -H 'Host: example.org' http://localhost/static/reset.css")
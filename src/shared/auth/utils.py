@@ -25,4 +25,7 @@ def ismaintainer(user: Any) -> bool:
 
 
 def user_can_edit_suggestion(user: Any) -> bool:
+    # Anonymous users can never edit, and a missing user has no groups to check.
+    if user is None or user.is_anonymous:
+        return False
     return isadmin(user) or iscommitter(user)
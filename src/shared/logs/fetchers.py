@@ -63,50 +63,47 @@ def _annotate_username(query: EventQuerySet) -> EventQuerySet:
 def fetch_suggestion_events(
     suggestion_ids: list[int],
 ) -> dict[int, list[RawEventType]]:
-    """Fetch all raw events for multiple suggestions in three batched queries."""
+    """Fetch all raw events for multiple suggestions in one batched query per event table."""
     result: dict[int, list[RawEventType]] = {sid: [] for sid in suggestion_ids}
 
     if not suggestion_ids:
         return result
 
-    creation_qs = _annotate_username(
-        CVEDerivationClusterProposalStatusEvent.objects.select_related(
-            "pgh_context"
-        ).filter(pgh_label="insert", pgh_obj_id__in=suggestion_ids)
-    )
-    for creation_event in creation_qs.iterator():
-        result[creation_event.pgh_obj_id].append(
-            RawCreationEvent(
-                suggestion_id=creation_event.pgh_obj_id,
-                timestamp=creation_event.pgh_created_at,
-                rejection_reason=CVEDerivationClusterProposal.RejectionReason(
-                    creation_event.rejection_reason
-                ).label.__str__()
-                if creation_event.rejection_reason is not None
-                else None,
-            )
-        )
-
+    # Creation and status change events live in the same table, so fetch them together.
+    # Events from one transaction share `pgh_created_at`, and sorting by time is stable.
+    # Keep insertion order, so that creation comes before status changes at the same time.
     status_qs = _annotate_username(
         CVEDerivationClusterProposalStatusEvent.objects.select_related("pgh_context")
-        .exclude(pgh_label="insert")
         .filter(pgh_obj_id__in=suggestion_ids)
+        .order_by("pgh_id")
     )
     for status_event in status_qs.iterator():
-        result[status_event.pgh_obj_id].append(
-            RawStatusEvent(
-                suggestion_id=status_event.pgh_obj_id,
-                timestamp=status_event.pgh_created_at,
-                username=status_event.username,
-                action=status_event.pgh_label,
-                status_value=status_event.status,
-                rejection_reason=CVEDerivationClusterProposal.RejectionReason(
-                    status_event.rejection_reason
-                ).label.__str__()
-                if status_event.rejection_reason is not None
-                else None,
-            )
+        rejection_reason = (
+            CVEDerivationClusterProposal.RejectionReason(
+                status_event.rejection_reason
+            ).label.__str__()
+            if status_event.rejection_reason is not None
+            else None
         )
+        if status_event.pgh_label == "insert":
+            result[status_event.pgh_obj_id].append(
+                RawCreationEvent(
+                    suggestion_id=status_event.pgh_obj_id,
+                    timestamp=status_event.pgh_created_at,
+                    rejection_reason=rejection_reason,
+                )
+            )
+        else:
+            result[status_event.pgh_obj_id].append(
+                RawStatusEvent(
+                    suggestion_id=status_event.pgh_obj_id,
+                    timestamp=status_event.pgh_created_at,
+                    username=status_event.username,
+                    action=status_event.pgh_label,
+                    status_value=status_event.status,
+                    rejection_reason=rejection_reason,
+                )
+            )
 
     package_qs = _annotate_username(
         PackageOverlayEvent.objects.select_related("pgh_context").filter(
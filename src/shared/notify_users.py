@@ -8,7 +8,6 @@ from django.template.defaultfilters import truncatewords
 from django.urls import reverse
 
 from shared.models.linkage import CVEDerivationClusterProposal
-from webview.models import Profile
 from webview.models import SuggestionNotification as Notification
 from webview.notifications.context import NotificationContext
 
@@ -80,7 +79,8 @@ def create_package_subscription_notifications(
     notifications = []
     for user in all_users_to_notify:
         try:
-            notification = Profile.objects.get(user=user).create_notification(
+            # Profiles were fetched along with the users
+            notification = user.profile.create_notification(
                 suggestion=suggestion,
             )
             notifications.append(notification)
@@ -44,6 +44,11 @@ from shared.notify_users import create_package_subscription_notifications
 from webview.models import SuggestionNotification as Notification
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    # Test passwords need no protection, and the default PBKDF2 hasher is slow by design.
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
 @pytest.fixture
 def cvss_v3_metric() -> dict:
     return {
@@ -105,17 +110,22 @@ def make_container(
             affected.cpes.add(cpe)
 
         container = cve.container.create(provider=org, title=title)
-        refs = []
-        for text, link, tags in references:
-            tag_objs: dict[str, Tag] = {}
+        tag_objs: dict[str, Tag] = {}
+        for _text, _link, tags in references:
             for tag in tags:
-                tag_objs[tag], _ = Tag.objects.get_or_create(value=tag)
-            ref = Reference.objects.create(
-                url=link,
-                name=text,
-            )
-            ref.tags.set(tag_objs.values())
-            refs.append(ref)
+                if tag not in tag_objs:
+                    tag_objs[tag], _ = Tag.objects.get_or_create(value=tag)
+        # Insert references and their tag links in one round-trip per table
+        refs = Reference.objects.bulk_create(
+            [Reference(url=link, name=text) for text, link, _tags in references]
+        )
+        Reference.tags.through.objects.bulk_create(
+            [
+                Reference.tags.through(reference=ref, tag=tag_objs[tag])
+                for ref, (_text, _link, tags) in zip(refs, references)
+                for tag in dict.fromkeys(tags)
+            ]
+        )
         container.references.set(refs)
         container.affected.add(affected)
         if description is not None:
@@ -343,12 +353,16 @@ def make_suggestion(
             )
             suggestion.refresh_from_db()
 
-        for drv, provenance in drvs.items():
-            DerivationClusterProposalLink.objects.create(
-                proposal=suggestion,
-                derivation=drv,
-                provenance_flags=provenance,
-            )
+        DerivationClusterProposalLink.objects.bulk_create(
+            [
+                DerivationClusterProposalLink(
+                    proposal=suggestion,
+                    derivation=drv,
+                    provenance_flags=provenance,
+                )
+                for drv, provenance in drvs.items()
+            ]
+        )
 
         return suggestion
 
@@ -4,7 +4,7 @@ from typing import Any
 import pytest
 from django.contrib.auth.models import User
 
-from shared.auth.utils import ismaintainer
+from shared.auth.utils import ismaintainer, user_can_edit_suggestion
 from shared.models.nix_evaluation import NixChannel
 
 
@@ -31,3 +31,7 @@ def test_ismaintainer_respects_channel_tip(
 def test_ismaintainer_false_for_non_maintainer(user: User) -> None:
     # user has no maintainer row at all
     assert ismaintainer(user) is False
+
+
+def test_missing_user_cannot_edit_suggestion() -> None:
+    assert user_can_edit_suggestion(None) is False
@@ -145,12 +145,11 @@ class Profile(models.Model):
 
     def mark_all_read_for_user(self) -> int:
         """Mark all notifications as read for a user and reset counter. Returns count of notifications marked."""
-        unread = Notification.objects.filter(user=self.user, is_read=False)
-        unread_count = unread.count()
+        unread_count = Notification.objects.filter(
+            user=self.user, is_read=False
+        ).update(is_read=True)
 
         if unread_count > 0:
-            unread.update(is_read=True)
-
             self.unread_notifications_count = 0
             self.save(update_fields=["unread_notifications_count"])
 
@@ -158,13 +157,10 @@ class Profile(models.Model):
 
     def clear_read_for_user(self) -> int:
         """Delete all read notifications for a user. Counter should remain unchanged."""
-        read = Notification.objects.filter(user=self.user, is_read=True)
-        count = read.count()
-
-        if count > 0:
-            read.delete()
+        _, deleted = Notification.objects.filter(user=self.user, is_read=True).delete()
 
-        return count
+        # The total also includes the subclass rows deleted along with each notification
+        return deleted.get(Notification._meta.label, 0)
 
     def subscribe_to_package(self, package: str) -> None:
         """Add a package to the subscribed packages."""
@@ -71,41 +71,28 @@ class SuggestionBaseView(TemplateView, ABC):
             current_url = request.META.get("HTTP_REFERER", "")
         return current_url
 
-    def _is_origin_url_a_list(self, request: HttpRequest) -> bool:
-        """Checks whether we come from one of the suggestion list views. Returns false when in doubt."""
+    def _get_origin_url_name(self, request: HttpRequest) -> str | None:
+        """Resolve the view name of the origin URL. Returns None when in doubt."""
         origin_url = self._get_origin_url(request)
         if not origin_url:
-            return False
-
-        # Extract path from URL
+            return None
         try:
-            # Resolve the URL to get view name
-            parsed = urlparse(origin_url)
-            resolved = resolve(parsed.path)
-
-            # Check if it's one of our list views
-            list_url_names = [
-                "untriaged_suggestions",
-                "accepted_suggestions",
-                "dismissed_suggestions",
-                "issue_list",
-            ]
-
-            return resolved.url_name in list_url_names
+            return resolve(urlparse(origin_url).path).url_name
         except Exception:
-            return False
-
-    def _is_origin_url_issue_draft(self, request: HttpRequest) -> bool:
+            return None
+
+    def _is_origin_url_a_list(self, origin_url_name: str | None) -> bool:
+        """Checks whether we come from one of the suggestion list views."""
+        return origin_url_name in [
+            "untriaged_suggestions",
+            "accepted_suggestions",
+            "dismissed_suggestions",
+            "issue_list",
+        ]
+
+    def _is_origin_url_issue_draft(self, origin_url_name: str | None) -> bool:
         """Checks whether we come from the issue draft view."""
-        origin_url = self._get_origin_url(request)
-        if not origin_url:
-            return False
-        try:
-            parsed = urlparse(origin_url)
-            resolved = resolve(parsed.path)
-            return resolved.url_name == "issue_draft"
-        except Exception:
-            return False
+        return origin_url_name == "issue_draft"
 
 
 class SuggestionContentEditBaseView(SuggestionBaseView, ABC):
@@ -1,5 +1,6 @@
 import logging
 
+import pglock
 from django.db import transaction
 from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
 from django.urls import reverse
@@ -32,8 +33,9 @@ class UpdateSuggestionStatusView(SuggestionBaseView):
 
     def post(self, request: HttpRequest, suggestion_id: int) -> HttpResponse:
         """Handle status change requests."""
-        user_can_edit = user_can_edit_suggestion(request.user)
-        if not request.user or not user_can_edit:
+        user = request.user
+        user_can_edit = user_can_edit_suggestion(user)
+        if not user or not user_can_edit:
             return HttpResponseForbidden()
 
         # Get form data
@@ -77,7 +79,9 @@ class UpdateSuggestionStatusView(SuggestionBaseView):
                 suggestion.comment = new_comment
             suggestion.save()
             if request.headers.get("HX-Request"):
-                if in_issue_draft == "0" and self._is_origin_url_issue_draft(request):
+                if in_issue_draft == "0" and self._is_origin_url_issue_draft(
+                    self._get_origin_url_name(request)
+                ):
                     # In case we come from the issue draft list, we want to remove the item
                     return HttpResponse("<template></template>")
                 else:
@@ -133,6 +137,27 @@ class UpdateSuggestionStatusView(SuggestionBaseView):
             elif new_status == "published":
                 try:
                     with transaction.atomic():
+                        # Serialize publication per suggestion, so a repeated submission fails fast instead of filing a second GitHub issue.
+                        # `xact=True` releases the lock when the surrounding transaction ends.
+                        if not pglock.advisory(
+                            f"publish-suggestion-{suggestion.pk}", xact=True, timeout=0
+                        ).acquire():
+                            return self._handle_error(
+                                request,
+                                suggestion_context,
+                                "Publication already in progress",
+                            )
+                        # The status checked above may predate a concurrent publication that has committed since.
+                        suggestion.refresh_from_db(fields=["status"])
+                        if (
+                            suggestion.status
+                            == CVEDerivationClusterProposal.Status.PUBLISHED
+                        ):
+                            return self._handle_error(
+                                request,
+                                suggestion_context,
+                                "Issue is already published",
+                            )
                         from django.template.defaultfilters import truncatewords
 
                         title = (
@@ -167,6 +192,36 @@ class UpdateSuggestionStatusView(SuggestionBaseView):
 
         suggestion.save()
 
+        # Without javascript we redirect, and the origin page is rendered anew.
+        # Skip refreshing a context that would be discarded.
+        if not request.headers.get("HX-Request"):
+            return self._redirect_to_origin(request)
+
+        # Resolve the origin once for all the checks below
+        origin_url_name = self._get_origin_url_name(request)
+
+        # In case we come from the issue draft list, we want to remove the item
+        if self._is_origin_url_issue_draft(origin_url_name):
+            return HttpResponse("<template></template>")
+
+        origin_is_list = self._is_origin_url_a_list(origin_url_name)
+
+        if new_status == "published" and not origin_is_list:
+            # NOTE(@florentc): This treats the case where we are in detail view
+            # for a suggestion and we publish it. In that case, with htmx, we
+            # don't want to replace the component in place because what we want
+            # to display from now on in a issue, not a suggestion. We therefore
+            # trigger a reload of the page on the client side, which will it
+            # turn redirect to the issue detail page.
+            # This is weird pattern break until we figure out what we want
+            # exactly regarding suggestion lifecycle on one side, and issue
+            # lifecycle on the other
+            response = HttpResponse()
+            response["HX-Redirect"] = self._get_origin_url(request) or reverse(
+                "webview:issue_list"
+            )
+            return response
+
         # Refresh activity_log
         suggestion_context.fetch_activity_log()
 
@@ -180,12 +235,7 @@ class UpdateSuggestionStatusView(SuggestionBaseView):
         ):
             maintainer_context.frozen = suggestion.is_frozen
 
-        # In case we come from the issue draft list, we want to remove the item
-        if self._is_origin_url_issue_draft(request):
-            if request.headers.get("HX-Request"):
-                return HttpResponse("<template></template>")
-
-        if self._is_origin_url_a_list(request):
+        if origin_is_list:
             # We don't display the status in lists (they are "by status" lists already)
             suggestion_context.show_status = False
             if not undo_status_change:
@@ -206,25 +256,5 @@ class UpdateSuggestionStatusView(SuggestionBaseView):
                     else None,
                     is_compact=is_compact,
                 )
-        elif new_status == "published":
-            # NOTE(@florentc): This treats the case where we are in detail view
-            # for a suggestion and we publish it. In that case, with htmx, we
-            # don't want to replace the component in place because what we want
-            # to display from now on in a issue, not a suggestion. We therefore
-            # trigger a reload of the page on the client side, which will it
-            # turn redirect to the issue detail page.
-            # This is weird pattern break until we figure out what we want
-            # exactly regarding suggestion lifecycle on one side, and issue
-            # lifecycle on the other
-            if request.headers.get("HX-Request"):
-                # For HTMX requests, use HX-Redirect header to trigger client-side redirect
-                response = HttpResponse()
-                response["HX-Redirect"] = self._get_origin_url(request) or reverse(
-                    "webview:issue_list"
-                )
-                return response
 
-        if request.headers.get("HX-Request"):
-            return self.render_to_response({"data": suggestion_context})
-        else:
-            return self._redirect_to_origin(request)
+        return self.render_to_response({"data": suggestion_context})
@@ -1,5 +1,6 @@
 import datetime
-from collections.abc import ItemsView
+import functools
+from operator import itemgetter
 from typing import Any, TypedDict
 from urllib.parse import quote, urlencode
 
@@ -33,8 +34,8 @@ register = template.Library()
 @register.filter
 def reverse_keys(
     value: dict[str, CachedSuggestion.PackageOnPrimaryChannel],
-) -> ItemsView[str, CachedSuggestion.PackageOnPrimaryChannel]:
-    return dict(sorted(value.items(), reverse=True)).items()
+) -> list[tuple[str, CachedSuggestion.PackageOnPrimaryChannel]]:
+    return sorted(value.items(), key=itemgetter(0), reverse=True)
 
 
 class Package(TypedDict):
@@ -137,6 +138,28 @@ CVSS_PARSERS = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_cvss_vector(
+    prefix: Metric.Format, vector_string: str
+) -> tuple[float, str, tuple[tuple[str, str], ...]]:
+    """
+    Parse a CVSS vector into its base score, base severity, and human-readable metrics.
+
+    Distinct vectors are few compared to the number of rendered metrics, so results are memoized.
+    They are returned as tuples to keep cached values immutable.
+    """
+    parser, abbreviations = CVSS_PARSERS[prefix]
+    parsed = parser(vector_string)
+    score, *_ = parsed.scores()
+    severity, *_ = parsed.severities()
+    human_readable = tuple(
+        # XXX(@fricklerhandwerk): Yes, the *value* description is also indexed by *key*, not by the value itself!
+        (f"{abbreviations[k]} ({k})", f"{parsed.get_value_description(k)} ({v})")
+        for k, v in parsed.metrics.items()
+    )
+    return score, severity.upper(), human_readable
+
+
 @register.inclusion_tag("components/severity_badge.html")
 def severity_badge(metrics: list[dict]) -> dict:
     """
@@ -146,32 +169,26 @@ def severity_badge(metrics: list[dict]) -> dict:
     # We may want to be precise about what to show here though.
     for metric in metrics:
         fmt = metric.get("format", "")
-        for prefix, (parser, abbreviations) in CVSS_PARSERS.items():
+        for prefix in CVSS_PARSERS:
             if fmt.startswith(prefix):
-                parsed = parser(metric["vector_string"])
-                score, *_ = parsed.scores()
-                severity, *_ = parsed.severities()
-
-                result = {
+                score, severity, human_readable = parse_cvss_vector(
+                    prefix, metric["vector_string"]
+                )
+                return {
                     "cvss": metric
                     | {
                         "version": Metric.Format(fmt).label,
                         "base_score": score,
-                        "base_severity": severity.upper(),
-                    }
+                        "base_severity": severity,
+                    },
+                    "human_readable": dict(human_readable),
                 }
-
-                result["human_readable"] = {
-                    # XXX(@fricklerhandwerk): Yes, the *value* description is also indexed by *key*, not by the value itself!
-                    f"{abbreviations[k]} ({k})": f"{parsed.get_value_description(k)} ({v})"
-                    for k, v in parsed.metrics.items()
-                }
-                return result
     return {}
 
 
 @register.filter
-def iso(date: datetime.datetime) -> str:
+def iso(date: datetime.datetime | str) -> str:
+    # Dates from cached payloads are serialized, while those from models are not.
     if isinstance(date, str):
         date = datetime.datetime.fromisoformat(date)
     return date.replace(microsecond=0).isoformat()
@@ -225,17 +242,18 @@ def suggestion_activity_log(
     }
 
 
+STATUS_ICONS = {
+    "pending": "icon-inbox",
+    "rejected": "icon-bin",
+    "accepted": "icon-draft",
+    "published": "icon-github",
+}
+
+
 @register.inclusion_tag("components/status_icon.html")
 def status_icon(status: str) -> dict[str, str]:
-    icon_mapping = {
-        "pending": "icon-inbox",
-        "rejected": "icon-bin",
-        "accepted": "icon-draft",
-        "published": "icon-github",
-    }
-    return {
-        "icon_class": icon_mapping.get(status, "icon-inbox")
-    }  # Default to inbox icon
+    # Default to inbox icon
+    return {"icon_class": STATUS_ICONS.get(status, "icon-inbox")}
 
 
 @register.inclusion_tag("suggestions/components/suggestion.html", takes_context=True)
@@ -24,6 +24,33 @@ pytest_plugins = ["shared.tests.conftest"]
 os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "js_only: exercises behavior that only exists with JavaScript enabled",
+    )
+    config.addinivalue_line(
+        "markers",
+        "playwright: drives a browser against the live server, deselect with `-m 'not playwright'`",
+    )
+
+
+# Run before `-m` deselection, so the `playwright` marker can be selected on.
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    for item in items:
+        if "page" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.playwright)
+        # Skip at collection time, so that no browser, live server or database fixtures are set up for nothing.
+        callspec = getattr(item, "callspec", None)
+        if (
+            item.get_closest_marker("js_only")
+            and callspec
+            and callspec.params.get("no_js")
+        ):
+            item.add_marker(pytest.mark.skip(reason="Requires JavaScript"))
+
+
 @pytest.fixture(params=[True, False])
 def no_js(request: FixtureRequest) -> bool:
     return request.param
@@ -34,6 +61,30 @@ def browser_context_args(no_js: bool) -> dict[str, Any]:
     return {"java_script_enabled": not no_js}
 
 
+@pytest.fixture(scope="session")
+def browser_type_launch_args(
+    browser_type_launch_args: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        **browser_type_launch_args,
+        "args": [
+            *browser_type_launch_args.get("args", []),
+            # The test VM has a small `/dev/shm`, which makes Chromium stall on larger pages.
+            "--disable-dev-shm-usage",
+            # Tests never need background updates or throttled rendering.
+            "--disable-background-networking",
+            "--disable-renderer-backgrounding",
+            # Nothing is displayed in headless runs, so skip GPU initialisation.
+            # Keep it for `--headed` debugging sessions, where rendering matters.
+            *(
+                ["--disable-gpu"]
+                if browser_type_launch_args.get("headless", True)
+                else []
+            ),
+        ],
+    }
+
+
 @pytest.fixture
 def mock_oauth_login(
     db: None,
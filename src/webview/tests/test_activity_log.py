@@ -40,7 +40,6 @@ def test_maintainer_addition_creates_activity_log_entry(
         f"#suggestion-activity-log-{cached_suggestion.pk}"
     )
     activity_log.click()
-    activity_log.get_by_text(staff.username)
     entry = (
         activity_log.filter(has_text=staff.username)
         .filter(has_text="added maintainer")
@@ -82,9 +81,10 @@ def test_ignore_maintainer_creates_activity_log_entry(
     as_staff.goto(live_server.url + reverse("webview:suggestion:untriaged_suggestions"))
     suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
     maintainers_list = suggestion.locator(f"#maintainers-list-{cached_suggestion.pk}")
-    maintainer_name, *_ = cached_suggestion.derivations.all().values_list(
+    maintainer_name = cached_suggestion.derivations.values_list(
         "metadata__maintainers__github", flat=True
-    )
+    ).first()
+    assert maintainer_name
     remove = maintainers_list.get_by_role("button", name="Ignore")
     remove.click()
     as_staff.locator(f"#suggestion-{cached_suggestion.pk}").get_by_text(
@@ -127,9 +127,10 @@ def test_restore_maintainer_cancels_event_in_activity_log(
     as_staff.goto(live_server.url + reverse("webview:suggestion:untriaged_suggestions"))
     suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
     maintainers_list = suggestion.locator(f"#maintainers-list-{cached_suggestion.pk}")
-    maintainer_name, *_ = cached_suggestion.derivations.all().values_list(
+    maintainer_name = cached_suggestion.derivations.values_list(
         "metadata__maintainers__github", flat=True
-    )
+    ).first()
+    assert maintainer_name
 
     remove = maintainers_list.get_by_role("button", name="Ignore")
     remove.click()
@@ -147,7 +148,6 @@ def test_restore_maintainer_cancels_event_in_activity_log(
     ).click()
 
     restore = maintainers_list.get_by_role("button", name="Restore")
-    expect(restore).to_be_visible()
     restore.click()
     expect(restore).not_to_be_visible()
 
@@ -155,7 +155,6 @@ def test_restore_maintainer_cancels_event_in_activity_log(
         f"#suggestion-activity-log-{cached_suggestion.pk}"
     )
     if not within_interval:
-        expect(activity_log).to_be_visible()
         activity_log.click()
         removed_maintainer = (
             activity_log.filter(has_text=staff.username)
@@ -203,7 +202,6 @@ def test_multiple_maintainer_edits_are_batched_in_activity_log(
     activity_log = suggestion.locator(
         f"#suggestion-activity-log-{cached_suggestion.pk}"
     )
-    expect(activity_log).to_be_visible()
     activity_log.click()
     # FIXME(@fricklerhandwerk): We may want to not collapse events that are further apart than some threshold.
     added_maintainers = (
@@ -262,7 +260,6 @@ def test_maintainer_edits_by_different_users_not_batched(
         activity_log = suggestion.locator(
             f"#suggestion-activity-log-{cached_suggestion.pk}"
         )
-        expect(activity_log).to_be_visible()
         activity_log.click()
         added_maintainer1 = (
             activity_log.filter(has_text=user1.username)
@@ -1,3 +1,6 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
 from django.urls import reverse
 from playwright.sync_api import Page, expect
 from pytest_django.live_server_helper import LiveServer
@@ -31,23 +34,38 @@ def test_dismiss_requires_comment_htmx(
     expect(error).to_be_visible()
 
 
-def test_dismiss_with_comment_succeeds(
+@pytest.mark.parametrize(
+    "action,comment_text,destination",
+    [
+        (
+            "Dismiss",
+            "This suggestion is not relevant because the package is deprecated.",
+            "webview:suggestion:dismissed_suggestions",
+        ),
+        (
+            "Accept",
+            "This looks good, creating draft issue.",
+            "webview:suggestion:accepted_suggestions",
+        ),
+    ],
+)
+def test_status_change_with_comment_shows_comment_in_context(
     live_server: LiveServer,
     as_staff: Page,
     cached_suggestion: CVEDerivationClusterProposal,
     no_js: bool,
+    action: str,
+    comment_text: str,
+    destination: str,
 ) -> None:
-    """Test that dismissing with a comment works and the comment appears in the view context"""
+    """Test that changing the status with a comment works and the comment appears in the view context"""
     as_staff.goto(live_server.url + reverse("webview:suggestion:untriaged_suggestions"))
     suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
-    comment_text = "This suggestion is not relevant because the package is deprecated."
     suggestion.locator("textarea").fill(comment_text)
-    dismiss = suggestion.get_by_role("button", name="Dismiss")
-    dismiss.click()
+    button = suggestion.get_by_role("button", name=action)
+    button.click()
     if no_js:
-        as_staff.goto(
-            live_server.url + reverse("webview:suggestion:dismissed_suggestions")
-        )
+        as_staff.goto(live_server.url + reverse(destination))
     else:
         link = as_staff.get_by_role("link", name="View")
         link.click()
@@ -77,31 +95,6 @@ def test_accept_without_comment_succeeds(
     expect(suggestion).to_be_visible()
 
 
-def test_accept_with_comment_shows_comment_in_context(
-    live_server: LiveServer,
-    as_staff: Page,
-    cached_suggestion: CVEDerivationClusterProposal,
-    no_js: bool,
-) -> None:
-    """Test that accepting with a comment shows the comment in the view context"""
-    as_staff.goto(live_server.url + reverse("webview:suggestion:untriaged_suggestions"))
-    suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
-    comment_text = "This looks good, creating draft issue."
-    suggestion.locator("textarea").fill(comment_text)
-    accept = suggestion.get_by_role("button", name="Accept")
-    accept.click()
-    if no_js:
-        as_staff.goto(
-            live_server.url + reverse("webview:suggestion:accepted_suggestions")
-        )
-    else:
-        link = as_staff.get_by_role("link", name="View")
-        link.click()
-    expect(suggestion).to_be_visible()
-    comment = suggestion.locator("textarea")
-    expect(comment).to_have_value(comment_text)
-
-
 def test_updating_comment_on_existing_suggestion(
     live_server: LiveServer,
     as_staff: Page,
@@ -138,40 +131,33 @@ def test_updating_comment_on_existing_suggestion(
 
 
 def test_get_requests_ignored(
-    live_server: LiveServer,
-    as_staff: Page,
+    client: Client,
+    staff: User,
     cached_suggestion: CVEDerivationClusterProposal,
-    no_js: bool,
 ) -> None:
+    """
+    Check that the HTTP API rejects GET requests.
+    """
     drv = cached_suggestion.derivations.first()
     assert drv
-    with as_staff.expect_response(lambda response: response.status == 405):
-        """
-        Check that the HTTP API rejects GET requests.
-        """
-        as_staff.goto(
-            live_server.url
-            + reverse(
-                "webview:suggestion:update_status",
-                kwargs={"suggestion_id": cached_suggestion.pk},
-            ),
-        )
-        as_staff.goto(
-            live_server.url
-            + reverse(
-                "webview:suggestion:ignore_package",
-                kwargs={
-                    "suggestion_id": cached_suggestion.pk,
-                    "package_attr": drv.attribute,
-                },
-            ),
-        )
-        as_staff.goto(
-            live_server.url
-            + reverse(
-                "webview:suggestion:add_maintainer",
-                kwargs={
-                    "suggestion_id": cached_suggestion.pk,
-                },
-            ),
-        )
+    client.force_login(staff)
+    for url in [
+        reverse(
+            "webview:suggestion:update_status",
+            kwargs={"suggestion_id": cached_suggestion.pk},
+        ),
+        reverse(
+            "webview:suggestion:ignore_package",
+            kwargs={
+                "suggestion_id": cached_suggestion.pk,
+                "package_attr": drv.attribute,
+            },
+        ),
+        reverse(
+            "webview:suggestion:add_maintainer",
+            kwargs={
+                "suggestion_id": cached_suggestion.pk,
+            },
+        ),
+    ]:
+        assert client.get(url).status_code == 405
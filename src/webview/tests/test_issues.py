@@ -4,6 +4,8 @@ from typing import Any
 from unittest.mock import patch
 
 import pytest
+from django.contrib.auth.models import User
+from django.test import Client
 from django.urls import reverse
 from github import Github
 from github.Issue import Issue as GithubIssue
@@ -11,7 +13,6 @@ from playwright.sync_api import Page, expect
 from pytest_django.live_server_helper import LiveServer
 from pytest_mock import MockerFixture
 
-from shared.cache_suggestions import cache_new_suggestions
 from shared.github import create_gh_issue
 from shared.models.cve import (
     Container,
@@ -38,7 +39,7 @@ from shared.tests.test_github_sync import MockGithub
 )
 def test_publish_gh_issue_empty_title(
     make_container: Callable[..., Container],
-    make_suggestion: Callable[..., CVEDerivationClusterProposal],
+    make_cached_suggestion: Callable[..., CVEDerivationClusterProposal],
     drv: NixDerivation,
     live_server: LiveServer,
     as_staff: Page,
@@ -51,10 +52,9 @@ def test_publish_gh_issue_empty_title(
     # [tag:test-github-create_issue-title]
 
     container = make_container(title=title, description=description)
-    accepted_suggestion = make_suggestion(
+    accepted_suggestion = make_cached_suggestion(
         container=container, status=CVEDerivationClusterProposal.Status.ACCEPTED
     )
-    cache_new_suggestions(accepted_suggestion)
 
     as_staff.goto(live_server.url + reverse("webview:suggestion:accepted_suggestions"))
     suggestion = as_staff.locator(f"#suggestion-{accepted_suggestion.cached.pk}")
@@ -103,7 +103,7 @@ def test_publish_gh_issue_empty_title(
     [True, False],
 )
 def test_maintainer_of_active_package_mentioned_in_issue(
-    make_suggestion: Callable[..., CVEDerivationClusterProposal],
+    make_cached_suggestion: Callable[..., CVEDerivationClusterProposal],
     live_server: LiveServer,
     as_staff: Page,
     no_js: bool,
@@ -112,10 +112,9 @@ def test_maintainer_of_active_package_mentioned_in_issue(
 ) -> None:
     """Test that the body of a created issue mentions the maintainer, unless the package has been ignored."""
 
-    accepted_suggestion = make_suggestion(
+    accepted_suggestion = make_cached_suggestion(
         status=CVEDerivationClusterProposal.Status.ACCEPTED
     )
-    cache_new_suggestions(accepted_suggestion)
 
     as_staff.goto(live_server.url + reverse("webview:suggestion:accepted_suggestions"))
     suggestion = as_staff.locator(f"#suggestion-{accepted_suggestion.pk}")
@@ -181,6 +180,94 @@ def test_maintainer_of_active_package_mentioned_in_issue(
         assert f"@{maintainer_handle}" in issue_body
 
 
+@pytest.mark.parametrize("htmx", [True, False])
+def test_concurrent_publication_does_not_create_issue(
+    client: Client,
+    staff: User,
+    make_cached_suggestion: Callable[..., CVEDerivationClusterProposal],
+    mocker: MockerFixture,
+    htmx: bool,
+) -> None:
+    """
+    A publication request must fail without contacting GitHub while another one for the same suggestion is in progress.
+
+    This happens when users double-click "Publish", or publish from two tabs at once.
+    """
+    accepted_suggestion = make_cached_suggestion(
+        status=CVEDerivationClusterProposal.Status.ACCEPTED
+    )
+    # Simulate another transaction holding the publication lock.
+    mocker.patch("pglock.advisory").return_value.acquire.return_value = False
+    mock_create_gh_issue = mocker.patch("shared.github.create_gh_issue")
+
+    client.force_login(staff)
+    response = client.post(
+        reverse("webview:suggestion:update_status", args=[accepted_suggestion.pk]),
+        data={"new_status": "published"},
+        headers={"HX-Request": "true"} if htmx else {},
+        # Without HTMX, the error is shown as a message on the page we are redirected to.
+        follow=True,
+    )
+
+    assert b"Publication already in progress" in response.content
+    mock_create_gh_issue.assert_not_called()
+    accepted_suggestion.refresh_from_db()
+    assert accepted_suggestion.status == CVEDerivationClusterProposal.Status.ACCEPTED
+
+
+@pytest.mark.parametrize("htmx", [True, False])
+def test_publication_after_concurrent_publication_does_not_create_issue(
+    client: Client,
+    staff: User,
+    make_cached_suggestion: Callable[..., CVEDerivationClusterProposal],
+    mocker: MockerFixture,
+    htmx: bool,
+) -> None:
+    """
+    A publication request must not contact GitHub if another one completed after the suggestion was loaded.
+
+    The other request releases the publication lock when it commits, so only the status read under the lock can tell.
+    """
+    accepted_suggestion = make_cached_suggestion(
+        status=CVEDerivationClusterProposal.Status.ACCEPTED
+    )
+    mock_advisory = mocker.patch("pglock.advisory")
+    mock_advisory.return_value.acquire.return_value = True
+    mock_create_gh_issue = mocker.patch("shared.github.create_gh_issue")
+
+    refresh_from_db = CVEDerivationClusterProposal.refresh_from_db
+
+    # Simulate the other publication committing between loading the suggestion and acquiring the lock.
+    def publish_concurrently(
+        self: CVEDerivationClusterProposal, *args: Any, **kwargs: Any
+    ) -> None:
+        CVEDerivationClusterProposal.objects.filter(pk=self.pk).update(
+            status=CVEDerivationClusterProposal.Status.PUBLISHED
+        )
+        refresh_from_db(self, *args, **kwargs)
+
+    mocker.patch.object(
+        CVEDerivationClusterProposal,
+        "refresh_from_db",
+        autospec=True,
+        side_effect=publish_concurrently,
+    )
+
+    client.force_login(staff)
+    response = client.post(
+        reverse("webview:suggestion:update_status", args=[accepted_suggestion.pk]),
+        data={"new_status": "published"},
+        headers={"HX-Request": "true"} if htmx else {},
+        # Without HTMX, the error is shown as a message on the page we are redirected to.
+        follow=True,
+    )
+
+    mock_advisory.return_value.acquire.assert_called_once()
+    assert b"Issue is already published" in response.content
+    mock_create_gh_issue.assert_not_called()
+    assert not NixpkgsIssue.objects.filter(suggestions=accepted_suggestion).exists()
+
+
 def test_cvss_base_score_visible_in_web_ui(
     make_cached_suggestion: Callable[..., CVEDerivationClusterProposal],
     mocker: MockerFixture,
@@ -2,9 +2,13 @@ import re
 from collections.abc import Callable
 from contextlib import AbstractContextManager
 
+import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 from pytest_django.live_server_helper import LiveServer
 
 from shared.models.nix_evaluation import NixDerivation, NixMaintainer
@@ -13,6 +17,16 @@ from webview.models import Notification
 from ..notifications.views import NotificationCenterView
 
 
+def notification_cards(
+    page: Page, notifications: list[Notification], visible: bool = False
+) -> Locator:
+    """Locate all given notifications at once, to check them in one round-trip."""
+    state = ":visible" if visible else ""
+    return page.locator(
+        ", ".join(f"#notification-{n.pk}{state}" for n in notifications)
+    )
+
+
 def test_mark_notification_read_unread(
     live_server: LiveServer,
     staff: User,
@@ -68,34 +82,28 @@ def test_notifications_bulk_operations(
         make_maintainer_notification(staff)[0] for i in range(num_notifications)
     ]
 
-    as_staff.goto(live_server.url + reverse("webview:suggestion:untriaged_suggestions"))
+    as_staff.goto(live_server.url + reverse("webview:notifications:center"))
     badge = as_staff.locator("#notifications-badge")
     expect(badge).to_have_text(str(num_notifications))
-    badge.click()
 
-    for db_notification in db_notifications:
-        notification = as_staff.locator(f"#notification-{db_notification.pk}")
-        expect(notification).to_be_visible()
-        mark_read = notification.get_by_role("button", name="Mark read")
-        expect(mark_read).to_be_visible()
+    notifications = notification_cards(as_staff, db_notifications, visible=True)
+    expect(notifications).to_have_count(num_notifications)
+    mark_read = notifications.get_by_role("button", name="Mark read")
+    expect(mark_read).to_have_count(num_notifications)
 
     all_read = as_staff.get_by_role("button", name="Mark all as read")
     all_read.click()
 
     expect(badge).to_have_text("0")
 
-    for db_notification in db_notifications:
-        notification = as_staff.locator(f"#notification-{db_notification.pk}")
-        expect(notification).to_be_visible()
-        mark_unread = notification.get_by_role("button", name="Mark unread")
-        expect(mark_unread).to_be_visible()
+    expect(notifications).to_have_count(num_notifications)
+    mark_unread = notifications.get_by_role("button", name="Mark unread")
+    expect(mark_unread).to_have_count(num_notifications)
 
     remove_read = as_staff.get_by_role("button", name="Remove read notification")
     remove_read.click()
 
-    for db_notification in db_notifications:
-        notification = as_staff.locator(f"#notification-{db_notification.pk}")
-        expect(notification).to_have_count(0)
+    expect(notification_cards(as_staff, db_notifications)).to_have_count(0)
 
     assert Notification.objects.count() == 0
 
@@ -116,32 +124,28 @@ def test_paginated_notifications(
         make_maintainer_notification(staff)[0] for i in range(num_notifications)
     ]
 
-    as_staff.goto(live_server.url + reverse("webview:suggestion:untriaged_suggestions"))
+    as_staff.goto(live_server.url + reverse("webview:notifications:center"))
     badge = as_staff.locator("#notifications-badge")
     expect(badge).to_have_text(str(num_notifications))
-    badge.click()
 
-    for i, db_notification in enumerate(reversed(db_notifications), start=1):
-        notification = as_staff.locator(f"#notification-{db_notification.pk}")
-        if i > page_size:
-            expect(notification).to_have_count(0)
-        else:
-            expect(notification).to_be_visible()
-            mark_read = notification.get_by_role("button", name="Mark read")
-            expect(mark_read).to_be_visible()
+    newest_first = db_notifications[::-1]
+    first_page, second_page = newest_first[:page_size], newest_first[page_size:]
+
+    notifications = notification_cards(as_staff, first_page, visible=True)
+    expect(notifications).to_have_count(len(first_page))
+    mark_read = notifications.get_by_role("button", name="Mark read")
+    expect(mark_read).to_have_count(len(first_page))
+    expect(notification_cards(as_staff, second_page)).to_have_count(0)
 
     pagination = as_staff.locator("#pagination")
     page_2 = pagination.get_by_role("link", name="2")
     page_2.click()
 
-    for i, db_notification in enumerate(reversed(db_notifications), start=1):
-        notification = as_staff.locator(f"#notification-{db_notification.pk}")
-        if i <= page_size:
-            expect(notification).to_have_count(0)
-        else:
-            expect(notification).to_be_visible()
-            mark_read = notification.get_by_role("button", name="Mark read")
-            expect(mark_read).to_be_visible()
+    notifications = notification_cards(as_staff, second_page, visible=True)
+    expect(notifications).to_have_count(len(second_page))
+    mark_read = notifications.get_by_role("button", name="Mark read")
+    expect(mark_read).to_have_count(len(second_page))
+    expect(notification_cards(as_staff, first_page)).to_have_count(0)
 
     mark_read = as_staff.get_by_text("Mark read")
     mark_read.click()
@@ -274,3 +278,30 @@ def test_text_notification_displayed(
     notification = as_staff.locator(f"#notification-{db_notification.pk}")
     expect(notification.get_by_text("Foo")).to_be_visible()
     expect(notification.get_by_text("Bar")).to_be_visible()
+
+
+@pytest.mark.parametrize("action", ["mark_all_read", "remove_all_read"])
+def test_bulk_notification_actions_query_count(
+    client: Client,
+    staff: User,
+    make_maintainer_notification: Callable[..., list[Notification]],
+    action: str,
+) -> None:
+    """
+    Check that bulk actions on notifications take a fixed number of queries, however many notifications they affect
+    """
+    url = reverse(f"webview:notifications:{action}")
+    client.force_login(staff)
+
+    def count_queries(num_notifications: int) -> int:
+        for _ in range(num_notifications):
+            make_maintainer_notification(staff)
+        if action == "remove_all_read":
+            Notification.objects.update(is_read=True)
+        with CaptureQueriesContext(connection) as queries:
+            client.post(url)
+        return len(queries)
+
+    # Warm up caches that are only filled on the first request
+    count_queries(1)
+    assert count_queries(1) == count_queries(3)
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 
+import pytest
 from django.contrib.auth.models import User
 from django.urls import reverse
 from playwright.sync_api import Page, expect
@@ -53,33 +54,28 @@ def test_dismiss_as_not_in_nixpkgs(
     expect(entry).to_be_visible()
 
 
+@pytest.mark.js_only
 def test_undo_preserves_rejection_reason(
     live_server: LiveServer,
     as_staff: Page,
     make_cached_suggestion: Callable[..., CVEDerivationClusterProposal],
-    no_js: bool,
 ) -> None:
     """Test that the rejection reason is preserved when undoing a status change from "dismissed" """
-    if not no_js:
-        reason = CVEDerivationClusterProposal.RejectionReason.NOT_IN_NIXPKGS
-        reason_label = (
-            CVEDerivationClusterProposal.RejectionReason.NOT_IN_NIXPKGS.label.__str__()
-        )
-        cached_suggestion = make_cached_suggestion(
-            status=CVEDerivationClusterProposal.Status.REJECTED, rejection_reason=reason
-        )
-        as_staff.goto(
-            live_server.url + reverse("webview:suggestion:dismissed_suggestions")
-        )
-        suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
-        suggestion_status = as_staff.locator(
-            f"#suggestion-{cached_suggestion.pk}-status"
-        )
-        # Verify that the dismissal reason is visible initially
-        expect(suggestion_status.get_by_text(reason_label)).to_be_visible()
-        # Accept the suggestion
-        suggestion.get_by_role("button", name="Accept").click()
-        # Undo the action
-        suggestion.get_by_role("button", name="Undo").click()
-        # Verify that the dismissal reason is still visible
-        expect(suggestion_status.get_by_text(reason_label)).to_be_visible()
+    reason = CVEDerivationClusterProposal.RejectionReason.NOT_IN_NIXPKGS
+    reason_label = (
+        CVEDerivationClusterProposal.RejectionReason.NOT_IN_NIXPKGS.label.__str__()
+    )
+    cached_suggestion = make_cached_suggestion(
+        status=CVEDerivationClusterProposal.Status.REJECTED, rejection_reason=reason
+    )
+    as_staff.goto(live_server.url + reverse("webview:suggestion:dismissed_suggestions"))
+    suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
+    suggestion_status = as_staff.locator(f"#suggestion-{cached_suggestion.pk}-status")
+    # Verify that the dismissal reason is visible initially
+    expect(suggestion_status.get_by_text(reason_label)).to_be_visible()
+    # Accept the suggestion
+    suggestion.get_by_role("button", name="Accept").click()
+    # Undo the action
+    suggestion.get_by_role("button", name="Undo").click()
+    # Verify that the dismissal reason is still visible
+    expect(suggestion_status.get_by_text(reason_label)).to_be_visible()
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 
+import pytest
 from django.contrib.auth.models import User
 from django.test import Client
 from django.urls import reverse
@@ -10,25 +11,22 @@ from shared.models.issue import NixpkgsIssue
 from shared.models.linkage import CVEDerivationClusterProposal
 
 
+@pytest.mark.js_only
 def test_undo_status_change_from_untriaged(
     live_server: LiveServer,
     as_staff: Page,
     cached_suggestion: CVEDerivationClusterProposal,
-    no_js: bool,
 ) -> None:
     """Test undoing a status change from untriaged restores the suggestion to untriaged"""
-    if not no_js:
-        as_staff.goto(
-            live_server.url + reverse("webview:suggestion:untriaged_suggestions")
-        )
-        suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
-        accept = suggestion.get_by_role("button", name="Accept")
-        accept.click()
-        undo = suggestion.get_by_role("button", name="Undo")
-        undo.click()
-        expect(suggestion).to_be_visible()
-        # We check that we are back to untriaged status from the presence of the Accept button
-        expect(accept).to_be_visible()
+    as_staff.goto(live_server.url + reverse("webview:suggestion:untriaged_suggestions"))
+    suggestion = as_staff.locator(f"#suggestion-{cached_suggestion.pk}")
+    accept = suggestion.get_by_role("button", name="Accept")
+    accept.click()
+    undo = suggestion.get_by_role("button", name="Undo")
+    undo.click()
+    expect(suggestion).to_be_visible()
+    # We check that we are back to untriaged status from the presence of the Accept button
+    expect(accept).to_be_visible()
 
 
 def test_cannot_transition_from_published(
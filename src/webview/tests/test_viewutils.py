@@ -1,6 +1,6 @@
 from shared.models.cve import Metric
 from shared.models.linkage import CVEDerivationClusterProposal
-from webview.templatetags.viewutils import severity_badge
+from webview.templatetags.viewutils import parse_cvss_vector, severity_badge
 
 
 def test_severity_badge(
@@ -22,3 +22,18 @@ def test_severity_badge(
     assert metric["cvss"]["base_score"]
     assert metric["cvss"]["base_severity"]
     assert metric["human_readable"]
+
+
+def test_severity_badge_parses_each_vector_once(
+    cached_suggestion: CVEDerivationClusterProposal,
+) -> None:
+    metrics = cached_suggestion.cached.payload["metrics"]
+    parse_cvss_vector.cache_clear()
+
+    first = severity_badge(metrics)
+    second = severity_badge(metrics)
+
+    assert first == second
+    info = parse_cvss_vector.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1